@@ -125,15 +125,12 @@ class ParakeetASR:
         if not sherpa_onnx:
             raise ImportError("sherpa-onnx is required for Parakeet ASR.")
 
-        config = load_config()
+        asr_config = load_config().asr
         if model_dir is None:
-            model_dir = config.get("asr", {}).get(
-                "parakeet_model_dir",
-                "models/sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8",
-            )
+            model_dir = asr_config.parakeet_model_dir
 
         self.model_dir = model_dir
-        self.enable_vad = config.get("asr", {}).get("enable_vad", False)
+        self.enable_vad = asr_config.enable_vad
         self.expected_sample_rate = 16000
 
         self._check_assets()
@@ -212,7 +209,8 @@ class ParakeetASR:
             audio_file (str): Path to the audio file.
 
         Returns:
-            Dict[str, Any]: Transcription output containing text, timestamps, and tokens.
+            Dict[str, Any]: Transcription output containing text, timestamps, tokens,
+            and the audio duration in seconds.
         """
         if not os.path.exists(audio_file):
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
@@ -249,10 +247,16 @@ class ParakeetASR:
 
         logger.debug(f"Processed audio shape: {audio.shape}, dtype: {audio.dtype}")
 
+        # Known from the samples already in memory, so callers need not re-open
+        # the file for it
+        duration = len(audio) / sample_rate
+
         # If audio is longer than 60 seconds (16000 * 60 samples), use chunked processing
         if len(audio) > 60 * sample_rate:
             logger.info("Audio is long (>60s), using chunked processing.")
-            return self._transcribe_long_audio(audio, sample_rate)
+            result = self._transcribe_long_audio(audio, sample_rate)
+            result["duration"] = duration
+            return result
 
         # TODO: Implement VAD preprocessing if enabled to remove silence
         if self.enable_vad:
@@ -269,6 +273,7 @@ class ParakeetASR:
             "text": result.text,
             "timestamps": result.timestamps,
             "tokens": result.tokens,
+            "duration": duration,
         }
 
     def _transcribe_long_audio(
@@ -94,8 +94,7 @@ def convert_to_wav(input_path: str) -> str:
 
     # Check for Demucs
     try:
-        config = load_config()
-        if config.get("asr", {}).get("enable_demucs", False):
+        if load_config().asr.enable_demucs:
             input_path = apply_demucs(input_path)
     except Exception as e:
         logger.warning(f"Failed to load config or apply Demucs: {e}")
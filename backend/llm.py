@@ -3,46 +3,36 @@ import json
 import logging
 import os
 import wave
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import requests
 from google import genai
 from google.genai import types
 
-from backend.utils import load_config
+from backend.utils import LlmConfig, load_config
 
 logger = logging.getLogger(__name__)
 
 
-def chat_completion(
+def _chat_request(
+    llm_config: LlmConfig,
     messages: List[Dict[str, str]],
-    model: Optional[str] = None,
-    api_key: Optional[str] = None,
-    base_url: Optional[str] = None,
-    raise_on_error: bool = False,
-) -> Optional[Dict[str, Any]]:
+    model: Optional[str],
+    api_key: Optional[str],
+    base_url: Optional[str],
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
     """
-    Sends a chat completion request to the LLM API.
-
-    Args:
-        messages (List[Dict[str, str]]): List of message dictionaries.
-        model (Optional[str]): Model name to use. Defaults to config.
-        api_key (Optional[str]): API key to use. Defaults to config/env.
-        base_url (Optional[str]): Base URL to use. Defaults to config.
-        raise_on_error (bool): Whether to raise an exception on error.
-
-    Returns:
-        Optional[Dict[str, Any]]: The JSON response from the API, or None if failed.
+    Resolves credentials and builds the URL, headers and body of a chat
+    completion request. Shared by the sync and async clients; the config is
+    passed in so async callers can load it off the event loop.
     """
-    config = load_config()
-    llm_config = config.get("llm", {})
-
     # Prioritize argument -> environment variable -> config
-    api_key = api_key or os.getenv("LLM_API_KEY") or llm_config.get("api_key")
-    base_url = base_url or llm_config.get("base_url")
+    api_key = api_key or os.getenv("LLM_API_KEY") or llm_config.api_key
+    base_url = base_url or llm_config.base_url
     if base_url:
         base_url = base_url.rstrip("/")
-    default_model = llm_config.get("model")
+    default_model = llm_config.model
 
     if not api_key:
         logger.error(
@@ -64,6 +54,32 @@ def chat_completion(
     }
 
     data = {"model": model or default_model, "messages": messages}
+    return url, headers, data
+
+
+def chat_completion(
+    messages: List[Dict[str, str]],
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    raise_on_error: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Sends a chat completion request to the LLM API.
+
+    Args:
+        messages (List[Dict[str, str]]): List of message dictionaries.
+        model (Optional[str]): Model name to use. Defaults to config.
+        api_key (Optional[str]): API key to use. Defaults to config/env.
+        base_url (Optional[str]): Base URL to use. Defaults to config.
+        raise_on_error (bool): Whether to raise an exception on error.
+
+    Returns:
+        Optional[Dict[str, Any]]: The JSON response from the API, or None if failed.
+    """
+    url, headers, data = _chat_request(
+        load_config().llm, messages, model, api_key, base_url
+    )
 
     response = None
     try:
@@ -81,6 +97,47 @@ def chat_completion(
         return None
 
 
+async def async_chat_completion(
+    client: httpx.AsyncClient,
+    llm_config: LlmConfig,
+    messages: List[Dict[str, str]],
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    raise_on_error: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Async counterpart of chat_completion for callers on the event loop.
+
+    Args:
+        client (httpx.AsyncClient): Shared client, so connections are reused.
+        llm_config (LlmConfig): Loaded config supplying the defaults.
+        messages (List[Dict[str, str]]): List of message dictionaries.
+        model (Optional[str]): Model name to use. Defaults to config.
+        api_key (Optional[str]): API key to use. Defaults to config/env.
+        base_url (Optional[str]): Base URL to use. Defaults to config.
+        raise_on_error (bool): Whether to raise an exception on error.
+
+    Returns:
+        Optional[Dict[str, Any]]: The JSON response from the API, or None if failed.
+    """
+    url, headers, data = _chat_request(llm_config, messages, model, api_key, base_url)
+
+    try:
+        response = await client.post(url, headers=headers, json=data)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"LLM Request failed: {e}")
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error(f"Response: {e.response.text}")
+
+        if raise_on_error:
+            raise e
+
+        return None
+
+
 def split_text_by_meaning(text: str, max_length: int = 80) -> List[str]:
     """
     Uses LLM to split text into meaningful segments.
@@ -170,30 +227,21 @@ def tts_llm(text: str, options: Optional[Dict[str, Any]] = None) -> Optional[byt
     Returns:
         Optional[bytes]: The generated audio bytes, or None if failed.
     """
-    config = load_config()
-    tts_config = config.get("tts", {})
+    tts_config = load_config().tts
 
     # Merge defaults with user options
-    defaults = tts_config.get("defaults", {})
+    defaults = tts_config.defaults
     user_options = options or {}
 
-    # language = user_options.get("language", defaults.get("language", "de-DE")) # Not used in API directly yet, but good for future
-    speed = user_options.get(
-        "speed", defaults.get("speed", "Native conversational pace")
-    )
-    tone = user_options.get(
-        "tone", defaults.get("tone", "Clear, educational, engaging")
-    )
+    # language = user_options.get("language", defaults.language) # Not used in API directly yet, but good for future
+    speed = user_options.get("speed", defaults.speed)
+    tone = user_options.get("tone", defaults.tone)
 
     # API Key and Model
     api_key = (
-        user_options.get("api_key")
-        or os.getenv("TTS_API_KEY")
-        or tts_config.get("api_key")
-    )
-    model_name = user_options.get("model") or tts_config.get(
-        "model", "gemini-2.5-flash-preview-tts"
+        user_options.get("api_key") or os.getenv("TTS_API_KEY") or tts_config.api_key
     )
+    model_name = user_options.get("model") or tts_config.model
 
     if not api_key:
         logger.error(
@@ -206,9 +254,8 @@ def tts_llm(text: str, options: Optional[Dict[str, Any]] = None) -> Optional[byt
     # Determine Mode (Single vs Multi-speaker)
     is_multi_speaker = "Redner1" in text and "Redner2" in text
 
-    voice_map = tts_config.get("voice_map", {"male": "Orus", "female": "Kore"})
-    male_voice = voice_map.get("male", "Orus")
-    female_voice = voice_map.get("female", "Kore")
+    male_voice = tts_config.voice_map.male
+    female_voice = tts_config.voice_map.female
 
     # Construct Prompt
     system_instruction = (
@@ -1,9 +1,9 @@
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from backend.llm import split_text_by_meaning
-from backend.utils import load_config, get_joiner
+from backend.utils import Config, load_config
 import spacy
 from spacy.cli.download import download
 import itertools
@@ -24,8 +24,7 @@ _SPACY_LOCK = threading.Lock()
 
 
 def get_spacy_model(language: str):
-    config = load_config()
-    model_map = config.get("app", {}).get("spacy_model_map", DEFAULT_SPACY_MODEL_MAP)
+    model_map = load_config().app.spacy_model_map or DEFAULT_SPACY_MODEL_MAP
     model = model_map.get(language.lower(), "de_core_news_md")
     if language not in model_map:
         logger.warning(
@@ -41,9 +40,8 @@ def init_nlp(language: Optional[str] = None):
     """
     global _SPACY_CACHE
     try:
-        config = load_config()
         if language is None:
-            language = config.get("app", {}).get("source_language", "de")
+            language = load_config().app.source_language
 
         if language is None:
             language = "de"
@@ -107,7 +105,10 @@ def analyze_comma(start, doc, token):
 
 
 def split_by_comma(text, nlp):
-    doc = nlp(text)
+    return split_doc_by_comma(nlp(text))
+
+
+def split_doc_by_comma(doc):
     sentences = []
     start = 0
 
@@ -165,6 +166,7 @@ def split_by_connectors(text, context_words=5, nlp: Optional[Any] = None):
         for sent in sentences:
             doc = nlp(sent)
             start = 0
+            start_char = 0
 
             for i, token in enumerate(doc):
                 split_before, _ = analyze_connectors(doc, token)
@@ -191,13 +193,16 @@ def split_by_connectors(text, context_words=5, nlp: Optional[Any] = None):
                     and len(right_words) >= context_words
                     and split_before
                 ):
-                    new_sentences.append(doc[start : token.i].text.strip())
+                    # Slice the source string by character offset instead of
+                    # materialising a Span's text
+                    new_sentences.append(sent[start_char : token.idx].strip())
                     start = token.i
+                    start_char = token.idx
                     split_occurred = True
                     break
 
             if start < len(doc):
-                new_sentences.append(doc[start:].text.strip())
+                new_sentences.append(sent[start_char:].strip())
 
         if not split_occurred:
             break
@@ -216,7 +221,7 @@ def split_by_connectors(text, context_words=5, nlp: Optional[Any] = None):
 # --- Split Long by Root ---
 
 
-def split_long_sentence(doc):
+def split_long_sentence(doc, joiner: Optional[str] = None):
     tokens = [token.text for token in doc]
     n = len(tokens)
 
@@ -240,9 +245,8 @@ def split_long_sentence(doc):
     sentences = []
     i = n
 
-    config = load_config()
-    language = config.get("app", {}).get("source_language", "de")
-    joiner = get_joiner(language)
+    if joiner is None:
+        joiner = load_config().joiner
 
     while i > 0:
         j = prev[i]
@@ -256,7 +260,10 @@ logger = logging.getLogger(__name__)
 
 
 def align_segments_with_tokens(
-    parts: List[str], tokens: List[str], timestamps: List[float]
+    parts: List[str],
+    tokens: List[str],
+    timestamps: List[float],
+    joiner: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Aligns text segments with original tokens to retrieve precise timestamps.
@@ -266,6 +273,7 @@ def align_segments_with_tokens(
         parts (List[str]): List of text segments (e.g. from LLM).
         tokens (List[str]): List of original tokens from ASR.
         timestamps (List[float]): List of end timestamps for each token.
+        joiner (Optional[str]): Token joiner; defaults to the configured one.
 
     Returns:
         List[Dict[str, Any]]: Aligned segments with 'start' and 'end' keys.
@@ -281,9 +289,8 @@ def align_segments_with_tokens(
     # Use language-aware joiner for token concatenation
     # For languages like Chinese/Japanese, tokens don't need spaces
     # For others (English, German, etc.), they do
-    config = load_config()
-    language = config.get("app", {}).get("source_language", "de")
-    joiner = get_joiner(language)
+    if joiner is None:
+        joiner = load_config().joiner
     full_text = joiner.join(clean_tokens)
 
     if not full_text:
@@ -338,14 +345,16 @@ def align_segments_with_tokens(
 
     # Create normalized text and mapping back to original indices
     # We want to match alphanumeric characters only to be robust against punctuation changes
-    normalized_text = ""
-    norm_to_orig_map = []
+    norm_chars: List[str] = []
+    norm_to_orig_map: List[int] = []
 
     for i, char in enumerate(full_text):
         if char.isalnum():
-            normalized_text += char.lower()
+            norm_chars.append(char.lower())
             norm_to_orig_map.append(i)
 
+    normalized_text = "".join(norm_chars)
+
     aligned_segments: List[Dict[str, Any]] = []
     search_pos = 0
 
@@ -410,8 +419,39 @@ def align_segments_with_tokens(
     return aligned_segments
 
 
+def _split_long_parts(
+    parts: List[str],
+    max_len: int,
+    split: Callable[[Any], List[str]],
+    nlp: Optional[Any] = None,
+) -> List[str]:
+    """
+    Applies a splitter to the parts longer than max_len, preserving order.
+    Short parts never enter the stage. When nlp is given, the long parts are
+    parsed in one nlp.pipe batch and split receives a Doc instead of a str.
+    """
+    long_indices = [i for i, part in enumerate(parts) if len(part) > max_len]
+    if not long_indices:
+        return parts
+
+    long_parts = [parts[i] for i in long_indices]
+    if nlp is not None:
+        pieces = [split(doc) for doc in nlp.pipe(long_parts, batch_size=32)]
+    else:
+        pieces = [split(part) for part in long_parts]
+
+    split_map = dict(zip(long_indices, pieces))
+    new_parts: List[str] = []
+    for i, part in enumerate(parts):
+        if i in split_map:
+            new_parts.extend(split_map[i])
+        else:
+            new_parts.append(part)
+    return new_parts
+
+
 def split_sentences(
-    segments: List[Dict[str, Any]], config: Dict[str, Any]
+    segments: List[Dict[str, Any]], config: Config
 ) -> List[Dict[str, Any]]:
     """
     Refines segments using NLP to split long sentences.
@@ -420,18 +460,20 @@ def split_sentences(
     Args:
         segments (List[Dict[str, Any]]): List of segments with 'text', 'start', 'end' keys.
                                          Optional 'tokens' and 'timestamps' for precise alignment.
-        config (Dict[str, Any]): Configuration dict with 'app.max_split_length' key.
+        config (Config): Configuration providing 'app.max_split_length'.
 
     Returns:
         List[Dict[str, Any]]: List of refined segments with interpolated timestamps.
     """
     logger.info("Starting NLP sentence splitting...")
 
-    source_lang = config.get("app", {}).get("source_language", "de")
-    nlp = init_nlp(language=source_lang)
+    app_config = config.app
+    nlp = init_nlp(language=app_config.source_language)
 
-    max_len = config.get("app", {}).get("max_split_length", 80)
-    use_llm = config.get("app", {}).get("use_llm", False)
+    max_len = app_config.max_split_length
+    use_llm = app_config.use_llm
+    # Resolved once from the caller's config rather than per sentence
+    joiner = config.joiner
     logger.debug(f"Max split length set to: {max_len}, Use LLM: {use_llm}")
 
     refined_segments = []
@@ -463,40 +505,28 @@ def split_sentences(
             parts = [sent.text.strip() for sent in doc.sents]
 
             # 1. Split by comma
-            new_parts = []
-            for part in parts:
-                if len(part) > max_len:
-                    new_parts.extend(split_by_comma(part, nlp))
-                else:
-                    new_parts.append(part)
-            parts = new_parts
+            parts = _split_long_parts(parts, max_len, split_doc_by_comma, nlp=nlp)
 
             # 2. Split by connectors
-            new_parts = []
-            for part in parts:
-                if len(part) > max_len:
-                    new_parts.extend(
-                        split_by_connectors(part, context_words=5, nlp=nlp)
-                    )
-                else:
-                    new_parts.append(part)
-            parts = new_parts
+            parts = _split_long_parts(
+                parts,
+                max_len,
+                lambda part: split_by_connectors(part, context_words=5, nlp=nlp),
+            )
 
             # 3. Split by root (last resort for very long sentences)
-            new_parts = []
-            for part in parts:
-                if len(part) > max_len:
-                    doc_part = nlp(part)
-                    new_parts.extend(split_long_sentence(doc_part))
-                else:
-                    new_parts.append(part)
-            parts = new_parts
+            parts = _split_long_parts(
+                parts,
+                max_len,
+                lambda doc: split_long_sentence(doc, joiner),
+                nlp=nlp,
+            )
 
         # 4. Interpolate timestamps
         # Try to use token-based alignment if available
         aligned = []
         if tokens and timestamps:
-            aligned = align_segments_with_tokens(parts, tokens, timestamps)
+            aligned = align_segments_with_tokens(parts, tokens, timestamps, joiner)
 
         if aligned:
             refined_segments.extend(aligned)
@@ -1,9 +1,12 @@
+import dataclasses
 import logging
 import os
 import threading
-from typing import Any, Dict
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 from rich.logging import RichHandler
 
 from backend.exceptions import ConfigError
@@ -12,11 +15,18 @@ from backend.exceptions import ConfigError
 _3_1_SPLIT_BY_NLP = "output/log/split_by_nlp.txt"
 
 
+@cache
 def setup_logging() -> None:
     """
     Configures the logging system.
     Logs are output to the console (using Rich) and to a file in output/log/.
+    Runs once per process and leaves an already configured root logger alone.
     """
+    # basicConfig would ignore the handlers anyway, but only after the
+    # FileHandler below had opened the log file
+    if logging.getLogger().hasHandlers():
+        return
+
     log_dir = "output/log"
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, "decho.log")
@@ -31,89 +41,253 @@ def setup_logging() -> None:
     )
 
 
-_config_cache = None
-_config_loaded = False
+class _ConfigSection:
+    """Mapping-style read access for the config dataclasses."""
+
+    __slots__ = ()
+    # Set by @dataclass on each subclass
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a deep, mutable dict copy."""
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class LlmConfig(_ConfigSection):
+    api_key: str
+    base_url: str
+    model: str
+
+
+@dataclass(slots=True, frozen=True)
+class TtsVoiceMap(_ConfigSection):
+    male: str
+    female: str
+
+
+@dataclass(slots=True, frozen=True)
+class TtsDefaults(_ConfigSection):
+    speed: str
+    tone: str
+    language: str
+
+
+@dataclass(slots=True, frozen=True)
+class TtsConfig(_ConfigSection):
+    api_key: str
+    model: str
+    voice_map: TtsVoiceMap
+    defaults: TtsDefaults
+
+
+@dataclass(slots=True, frozen=True)
+class AsrConfig(_ConfigSection):
+    method: str
+    parakeet_model_dir: str
+    enable_demucs: bool
+    enable_vad: bool
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig(_ConfigSection):
+    max_split_length: int
+    use_llm: bool
+    source_language: str
+    target_language: str
+    spacy_model_map: Dict[str, str]
+
+
+@dataclass(slots=True, frozen=True)
+class Config(_ConfigSection):
+    llm: LlmConfig
+    tts: TtsConfig
+    asr: AsrConfig
+    app: AppConfig
+    # Token joiner for app.source_language, resolved once at load time
+    joiner: str
+
+
+# (mtime_ns, size) of the .env file; None when there is no .env
+_Stamp = Optional[Tuple[int, int]]
+
+# (dotenv stamp, config), published as a single reference; None until loaded
+_config_cache: Optional[Tuple[_Stamp, Config]] = None
 _config_lock = threading.Lock()
+_dotenv_path: Optional[str] = None
+# (stamp, parsed values) of the last .env read
+_dotenv_cache: Optional[Tuple[_Stamp, Dict[str, str]]] = None
+# Values written into os.environ from .env, by key
+_dotenv_applied: Dict[str, str] = {}
 
 
-def _str_to_bool(value: str) -> bool:
-    """Convert string to boolean."""
-    return value.lower() in ("true", "1", "yes", "on")
+def _dotenv_stamp() -> _Stamp:
+    """
+    Return the mtime and size of the project's .env file, or None if there is
+    none. The size catches edits that land within the mtime resolution.
+    """
+    global _dotenv_path
+    if _dotenv_path is None:
+        _dotenv_path = find_dotenv()
+    if not _dotenv_path:
+        return None
+    try:
+        st = os.stat(_dotenv_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
-def load_config(reload: bool = False) -> Dict[str, Any]:
+def _read_dotenv(stamp: _Stamp) -> Dict[str, str]:
+    """Return the parsed .env values, re-reading the file only when it changed."""
+    global _dotenv_cache
+    cached = _dotenv_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    values: Dict[str, str] = {}
+    if _dotenv_path and stamp is not None:
+        values = {k: v for k, v in dotenv_values(_dotenv_path).items() if v is not None}
+    _dotenv_cache = (stamp, values)
+    return values
+
+
+def _apply_dotenv(values: Dict[str, str], override: bool) -> None:
+    """
+    Bring os.environ in line with the .env values. Variables from the real
+    environment win unless override is set; keys applied from an earlier
+    .env are updated, or removed once they are gone from the file.
+    """
+    global _dotenv_applied
+    previous = _dotenv_applied
+    applied: Dict[str, str] = {}
+
+    for key, value in values.items():
+        current = os.environ.get(key)
+        # Still holding what we applied last time, so not set by anyone else
+        owned = key in previous and current == previous[key]
+        if current is None or owned or override:
+            os.environ[key] = value
+            applied[key] = value
+
+    for key, value in previous.items():
+        if key not in values and os.environ.get(key) == value:
+            del os.environ[key]
+
+    _dotenv_applied = applied
+
+
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+
+# Languages whose tokens are joined without spaces; everything else uses " "
+_JOINERS: Dict[str, str] = {"zh": ""}
+
+
+def load_config(reload: bool = False) -> Config:
     """
     Loads and validates the configuration from environment variables.
-    Caches the configuration for performance.
+    Caches the configuration for performance; the cache is invalidated
+    when the .env file's mtime or size changes.
     Thread-safe using double-checked locking pattern.
 
     Returns:
-        Dict[str, Any]: The configuration dictionary.
+        Config: The immutable configuration object. Sections are read as
+        attributes (``config.asr.method``); ``config["asr"]["method"]`` and
+        ``config.get("asr", {})`` keep working.
 
     Raises:
         ConfigError: If required configuration is missing or invalid.
     """
-    global _config_cache, _config_loaded
+    global _config_cache
+
+    stamp = _dotenv_stamp()
 
-    # Fast path: check if cache is valid without lock
-    if _config_cache is not None and not reload and _config_loaded:
-        return _config_cache
+    # Fast path: read the published state once, without the lock
+    cached = _config_cache
+    if cached is not None and not reload and cached[0] == stamp:
+        return cached[1]
 
     # Need to load config - acquire lock
     with _config_lock:
         # Double-check inside lock
-        if _config_cache is not None and not reload and _config_loaded:
-            return _config_cache
-
-        # Load .env file if it exists
-        load_dotenv(override=reload)
-
-        # Build configuration from environment variables
-        config = {
-            "llm": {
-                "api_key": os.getenv("LLM_API_KEY", ""),
-                "base_url": os.getenv("LLM_BASE_URL", ""),
-                "model": os.getenv("LLM_MODEL", ""),
-            },
-            "tts": {
-                "api_key": os.getenv("TTS_API_KEY", ""),
-                "model": os.getenv("TTS_MODEL", "gemini-2.5-flash-preview-tts"),
-                "voice_map": {
-                    "male": os.getenv("TTS_VOICE_MALE", "Orus"),
-                    "female": os.getenv("TTS_VOICE_FEMALE", "Kore"),
-                },
-                "defaults": {
-                    "speed": os.getenv("TTS_SPEED", "Native conversational pace"),
-                    "tone": os.getenv("TTS_TONE", "Clear, educational, engaging"),
-                    "language": os.getenv("TTS_LANGUAGE", "de-DE"),
-                },
-            },
-            "asr": {
-                "method": os.getenv("ASR_METHOD", "parakeet"),
-                "parakeet_model_dir": os.getenv(
+        cached = _config_cache
+        if cached is not None and not reload and cached[0] == stamp:
+            return cached[1]
+
+        # Apply .env file if it exists. An explicit reload lets it override
+        # the real environment, as load_dotenv(override=True) did.
+        _apply_dotenv(_read_dotenv(stamp), override=reload)
+
+        # Build configuration from a single snapshot of the environment
+        env = os.environ.copy()
+
+        raw_split_length = env.get("APP_MAX_SPLIT_LENGTH", "80")
+        try:
+            max_split_length = int(raw_split_length)
+        except ValueError:
+            raise ConfigError(
+                f"Invalid config: APP_MAX_SPLIT_LENGTH must be an integer, "
+                f"got {raw_split_length!r}"
+            ) from None
+
+        source_language = env.get("APP_SOURCE_LANGUAGE", "de")
+        config = Config(
+            llm=LlmConfig(
+                api_key=env.get("LLM_API_KEY", ""),
+                base_url=env.get("LLM_BASE_URL", ""),
+                model=env.get("LLM_MODEL", ""),
+            ),
+            tts=TtsConfig(
+                api_key=env.get("TTS_API_KEY", ""),
+                model=env.get("TTS_MODEL", "gemini-2.5-flash-preview-tts"),
+                voice_map=TtsVoiceMap(
+                    male=env.get("TTS_VOICE_MALE", "Orus"),
+                    female=env.get("TTS_VOICE_FEMALE", "Kore"),
+                ),
+                defaults=TtsDefaults(
+                    speed=env.get("TTS_SPEED", "Native conversational pace"),
+                    tone=env.get("TTS_TONE", "Clear, educational, engaging"),
+                    language=env.get("TTS_LANGUAGE", "de-DE"),
+                ),
+            ),
+            asr=AsrConfig(
+                method=env.get("ASR_METHOD", "parakeet"),
+                parakeet_model_dir=env.get(
                     "ASR_PARAKEET_MODEL_DIR",
                     "models/sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8",
                 ),
-                "enable_demucs": _str_to_bool(os.getenv("ASR_ENABLE_DEMUCS", "false")),
-                "enable_vad": _str_to_bool(os.getenv("ASR_ENABLE_VAD", "false")),
-            },
-            "app": {
-                "max_split_length": int(os.getenv("APP_MAX_SPLIT_LENGTH", "80")),
-                "use_llm": _str_to_bool(os.getenv("APP_USE_LLM", "true")),
-                "source_language": os.getenv("APP_SOURCE_LANGUAGE", "de"),
-                "target_language": os.getenv("APP_TARGET_LANGUAGE", "de"),
-                "spacy_model_map": {
-                    "de": os.getenv("APP_SPACY_MODEL_DE", "de_core_news_md"),
+                enable_demucs=(
+                    env.get("ASR_ENABLE_DEMUCS", "false").lower() in _BOOL_TRUE
+                ),
+                enable_vad=env.get("ASR_ENABLE_VAD", "false").lower() in _BOOL_TRUE,
+            ),
+            app=AppConfig(
+                max_split_length=max_split_length,
+                use_llm=env.get("APP_USE_LLM", "true").lower() in _BOOL_TRUE,
+                source_language=source_language,
+                target_language=env.get("APP_TARGET_LANGUAGE", "de"),
+                spacy_model_map={
+                    "de": env.get("APP_SPACY_MODEL_DE", "de_core_news_md"),
                 },
-            },
-        }
-
-        # Basic validation
-        if not config["asr"] or not config["app"]:
-            raise ConfigError("Invalid config: missing 'asr' or 'app' sections")
+            ),
+            joiner=_JOINERS.get(source_language, " "),
+        )
 
-        _config_cache = config
-        _config_loaded = True
+        # Publish only once the object is fully built
+        _config_cache = (stamp, config)
 
         return config
 
@@ -128,6 +302,4 @@ def get_joiner(language: str) -> str:
     Returns:
         str: The joiner character (" " or "").
     """
-    if language == "zh":
-        return ""
-    return " "
+    return _JOINERS.get(language, " ")
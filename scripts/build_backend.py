@@ -37,9 +37,13 @@ def build_backend():
         "--hidden-import=uvicorn.logging",
         "--hidden-import=uvicorn.loops",
         "--hidden-import=uvicorn.loops.auto",
+        "--hidden-import=uvicorn.loops.uvloop",
+        "--hidden-import=uvloop",
         "--hidden-import=uvicorn.protocols",
         "--hidden-import=uvicorn.protocols.http",
         "--hidden-import=uvicorn.protocols.http.auto",
+        "--hidden-import=uvicorn.protocols.http.httptools_impl",
+        "--hidden-import=httptools",
         "--hidden-import=uvicorn.lifespan",
         "--hidden-import=uvicorn.lifespan.on",
         "--hidden-import=engineio.async_drivers.aiohttp",
@@ -1,9 +1,22 @@
+import os
 import subprocess
 import sys
 import shutil
 from pathlib import Path
 
 
+def _link_or_copy(src, dst):
+    """
+    Hard-link src to dst, copying only if linking is not possible
+    (different volume, or a filesystem without hard links).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def build_local():
     project_root = Path(__file__).parent.parent
     server_entry = project_root / "server" / "main.py"
@@ -26,9 +39,13 @@ def build_local():
         "--hidden-import=uvicorn.logging",
         "--hidden-import=uvicorn.loops",
         "--hidden-import=uvicorn.loops.auto",
+        "--hidden-import=uvicorn.loops.uvloop",
+        "--hidden-import=uvloop",
         "--hidden-import=uvicorn.protocols",
         "--hidden-import=uvicorn.protocols.http",
         "--hidden-import=uvicorn.protocols.http.auto",
+        "--hidden-import=uvicorn.protocols.http.httptools_impl",
+        "--hidden-import=httptools",
         "--hidden-import=uvicorn.lifespan",
         "--hidden-import=uvicorn.lifespan.on",
         str(server_entry),
@@ -43,7 +60,7 @@ def build_local():
     dest_web = dist_dir / "web"
     if dest_web.exists():
         shutil.rmtree(dest_web)
-    shutil.copytree(web_out, dest_web)
+    shutil.copytree(web_out, dest_web, copy_function=_link_or_copy)
 
     print("Copying models...")
     models_dir = project_root / "models"
@@ -51,7 +68,7 @@ def build_local():
     if models_dir.exists():
         if dest_models.exists():
             shutil.rmtree(dest_models)
-        shutil.copytree(models_dir, dest_models)
+        shutil.copytree(models_dir, dest_models, copy_function=_link_or_copy)
     else:
         print("Warning: models directory not found.")
 
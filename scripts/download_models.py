@@ -1,4 +1,9 @@
+import hashlib
 import os
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import urllib.error
 import urllib.request
 import tarfile
 import logging
@@ -6,6 +11,110 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Copy/read buffer for the multi-hundred-MB archive
+BUFFER_SIZE = 1 << 20
+# Decompressed chunks allowed to queue up ahead of the writer thread
+MAX_PENDING_WRITES = 16
+# Optional SHA-256 of the model archive; the release page publishes none, so
+# verification is opt-in and a mismatch triggers one full re-download
+EXPECTED_SHA256 = os.environ.get("DECHO_MODEL_SHA256", "").strip().lower() or None
+
+
+class UnsafeArchiveError(tarfile.TarError):
+    """An archive member would be written outside the output directory."""
+
+
+def _extract_overlapped(archive_path, output_dir):
+    """
+    Extract regular files and directories from a .tar.bz2 archive.
+
+    bz2 decoding is inherently sequential, so the archive is still read front
+    to back on the calling thread; the decoded chunks are handed to a writer
+    thread so that disk writes overlap with decompression.
+    """
+    root = os.path.realpath(output_dir)
+    pending = deque()
+
+    with (
+        open(archive_path, "rb", buffering=BUFFER_SIZE) as f,
+        tarfile.open(fileobj=f, mode="r|bz2") as tar,
+        ThreadPoolExecutor(max_workers=1) as writer,
+    ):
+        for member in tar:
+            target = os.path.realpath(os.path.join(root, member.name))
+            if os.path.commonpath([root, target]) != root:
+                raise UnsafeArchiveError(f"Unsafe path in archive: {member.name}")
+
+            if member.isdir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            if not member.isfile():
+                logger.warning(f"Skipping non-regular archive member: {member.name}")
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            src = tar.extractfile(member)
+            with open(target, "wb") as dst:
+                while chunk := src.read(BUFFER_SIZE):
+                    pending.append(writer.submit(dst.write, chunk))
+                    if len(pending) > MAX_PENDING_WRITES:
+                        pending.popleft().result()
+                # Drain before the file is closed
+                while pending:
+                    pending.popleft().result()
+
+
+def _download(url, output_path):
+    """
+    Download url to output_path, resuming a partial file left by an earlier run.
+
+    Returns True once the file on disk is complete.
+    """
+    size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+    request = urllib.request.Request(url)
+    if size:
+        request.add_header("Range", f"bytes={size}-")
+        logger.info(f"Resuming download at {size} bytes...")
+
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        # The partial file already holds the whole archive
+        if e.code == 416 and size:
+            return True
+        raise
+
+    with response:
+        if response.status == 206:
+            mode = "ab"
+            # Content-Range: bytes <start>-<end>/<total>
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        else:
+            # Server ignored the range, start over
+            mode = "wb"
+            total = response.headers.get("Content-Length", "")
+        with open(output_path, mode, buffering=BUFFER_SIZE) as f:
+            shutil.copyfileobj(response, f, length=BUFFER_SIZE)
+
+    if total.isdigit() and os.path.getsize(output_path) != int(total):
+        logger.error(
+            f"Incomplete download: {os.path.getsize(output_path)} of {total} bytes"
+        )
+        return False
+    return True
+
+
+def _verify(output_path):
+    """Check the archive against EXPECTED_SHA256, if one is configured."""
+    if EXPECTED_SHA256 is None:
+        return True
+    with open(output_path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    if digest != EXPECTED_SHA256:
+        logger.error(f"Checksum mismatch: expected {EXPECTED_SHA256}, got {digest}")
+        return False
+    return True
+
 
 def download_model():
     url = "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models/sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8.tar.bz2"
@@ -40,18 +149,40 @@ def download_model():
 
     logger.info(f"Downloading {url}...")
     try:
-        urllib.request.urlretrieve(url, output_path)
+        if not _download(url, output_path):
+            return
+        if not _verify(output_path):
+            # A corrupt partial file cannot be resumed, fetch it from scratch
+            os.remove(output_path)
+            if not (_download(url, output_path) and _verify(output_path)):
+                return
     except Exception as e:
         logger.error(f"Failed to download model: {e}")
         return
 
     logger.info("Extracting...")
     try:
-        with tarfile.open(output_path, "r:bz2") as tar:
-            tar.extractall(output_dir)
-    except Exception as e:
+        _extract_overlapped(output_path, output_dir)
+    except UnsafeArchiveError as e:
+        # A hostile archive must not get a second, less careful extraction
         logger.error(f"Failed to extract model: {e}")
+        os.remove(output_path)
         return
+    except Exception as e:
+        logger.warning(f"Overlapped extraction failed ({e}), retrying serially...")
+        try:
+            # Stream mode ("r|bz2") reads the archive front to back without seeking
+            with (
+                open(output_path, "rb", buffering=BUFFER_SIZE) as f,
+                tarfile.open(fileobj=f, mode="r|bz2") as tar,
+            ):
+                tar.extractall(output_dir, filter="data")
+        except Exception as e:
+            logger.error(f"Failed to extract model: {e}")
+            # A complete but corrupt file would only be "resumed" (416) and
+            # fail again, so the next run has to download from byte 0
+            os.remove(output_path)
+            return
 
     if os.path.exists(output_path):
         os.remove(output_path)
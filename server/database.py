@@ -1,13 +1,35 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # The path to the SQLite database created by Prisma
 # Assuming the server runs from the root and the db is in web/prisma/dev.db
 SQLALCHEMY_DATABASE_URL = "sqlite:///./web/prisma/dev.db"
 
+# Sync endpoints run in a threadpool of 40, so the pool is sized to let
+# concurrent status polls each hold a connection instead of queueing for one.
+# LIFO reuse keeps the warm, recently used connections (and their page cache).
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=20,
+    max_overflow=40,
+    pool_use_lifo=True,
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    # WAL lets status polling read while a background task writes, and
+    # synchronous=NORMAL only fsyncs at checkpoints instead of every commit
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
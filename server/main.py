@@ -1,27 +1,172 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Receive, Scope, Send
 from server.routers import audio, config
 from server.database import engine, Base
+import asyncio
+import httpx
 import os
-from contextlib import asynccontextmanager
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Dict, Tuple
 from backend.asr import get_asr_instance
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Determine base directory
+if getattr(sys, "frozen", False):
+    base_dir = os.path.dirname(sys.executable)
+else:
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+frontend_dist_name = "web" if getattr(sys, "frozen", False) else "web/out"
+frontend_path = os.path.join(base_dir, frontend_dist_name)
+index_path = os.path.join(frontend_path, "index.html")
+
+# How often the cached index.html is checked against the file on disk
+INDEX_REFRESH_SECONDS = 5.0
+# LLM responses routinely take longer than httpx's 5 s default
+UPSTREAM_TIMEOUT_SECONDS = 30.0
+
+
+def _load_index(app: FastAPI) -> None:
+    """Read index.html into app.state so SPA fallbacks are served from memory."""
+    mtime = os.stat(index_path).st_mtime
+    with open(index_path, "rb") as f:
+        app.state.index_bytes = f.read()
+    app.state.index_mtime = mtime
+    app.state.index_checked_at = time.monotonic()
+
+
+def _scan_frontend(app: FastAPI) -> None:
+    """Record every file of the exported frontend as a URL-style relative path."""
+    known = set()
+    for root, _, files in os.walk(frontend_path):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), frontend_path)
+            known.add(rel_path.replace(os.sep, "/"))
+    app.state.known_files = frozenset(known)
+
+
+def _index_response(app: FastAPI) -> Response:
+    """Return the cached index.html, re-reading it if the file has changed."""
+    state = app.state
+    now = time.monotonic()
+    checked_at = getattr(state, "index_checked_at", None)
+    if checked_at is None or now - checked_at > INDEX_REFRESH_SECONDS:
+        try:
+            if checked_at is None or os.stat(index_path).st_mtime != state.index_mtime:
+                _load_index(app)
+            else:
+                state.index_checked_at = now
+        except OSError as e:
+            if checked_at is None:
+                raise
+            logger.warning(f"Failed to refresh {index_path}: {e}")
+    return Response(state.index_bytes, media_type="text/html")
+
+
+class SPAMiddleware:
+    """
+    Serves the exported frontend ahead of the router with a prefix check and
+    a set lookup: known files are sent directly, API/mount/docs paths pass
+    through, and every other GET falls back to index.html for SPA routing.
+    """
+
+    def __init__(self, app: ASGIApp, passthrough_prefixes: Tuple[str, ...]):
+        self.app = app
+        self.passthrough_prefixes = passthrough_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith(self.passthrough_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # The application this middleware is installed on, set by Starlette
+        app = scope["app"]
+        rel_path = path.lstrip("/")
+        response: Response
+        if rel_path in getattr(app.state, "known_files", frozenset()):
+            response = FileResponse(os.path.join(frontend_path, rel_path))
+        else:
+            response = _index_response(app)
+        await response(scope, receive, send)
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles for the content-hashed Next.js build output. The files never
+    change while the server runs, so successful lookups are kept instead of
+    re-stat'ing, and responses may be cached by the browser indefinitely.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only hits are stored, which bounds the cache by the build's file count
+        self._lookups: Dict[str, Tuple[str, os.stat_result]] = {}
+
+    def lookup_path(self, path: str) -> Tuple[str, os.stat_result | None]:
+        hit = self._lookups.get(path)
+        if hit is not None:
+            return hit
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            self._lookups[path] = (full_path, stat_result)
+        return full_path, stat_result
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create tables if they don't exist
     Base.metadata.create_all(bind=engine)
+    audio.reset_interrupted_tasks()
+
+    if os.path.isfile(index_path):
+        _load_index(app)
+        _scan_frontend(app)
 
-    # Preload ASR model
-    logger.info("Preloading ASR model...")
-    get_asr_instance()
-    logger.info("ASR model loaded.")
+    # Preload ASR model off the startup path so the port binds immediately.
+    # Transcription that starts before this finishes waits on the ASR
+    # singleton's lock rather than loading a second copy.
+    def _warm_asr():
+        logger.info("Preloading ASR model...")
+        try:
+            get_asr_instance()
+            logger.info("ASR model loaded.")
+        except Exception as e:
+            logger.error(f"Failed to preload ASR model: {e}")
+
+    threading.Thread(target=_warm_asr, name="asr-preload", daemon=True).start()
+    playback_flusher = asyncio.create_task(audio.run_playback_flusher())
+    # Shared by async upstream calls so TLS sessions and connections are reused
+    app.state.http_client = httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT_SECONDS)
     yield
 
+    await app.state.http_client.aclose()
+    playback_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await playback_flusher
+    audio.flush_playback_progress()
+
+    # Drop queued jobs; the one in progress is allowed to finish. Tasks left
+    # PROCESSING are released by reset_interrupted_tasks on the next start.
+    audio.task_executor.shutdown(wait=False, cancel_futures=True)
+
 
 app = FastAPI(title="DECHO API", version="1.0.0", lifespan=lifespan)
 
@@ -49,36 +194,27 @@ app.mount(
 app.include_router(audio.router, prefix="/api/audio", tags=["audio"])
 app.include_router(config.router, prefix="/api/config", tags=["config"])
 
-import sys
-from fastapi.responses import FileResponse
-
-# Determine base directory
-if getattr(sys, "frozen", False):
-    base_dir = os.path.dirname(sys.executable)
-else:
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
-frontend_dist_name = "web" if getattr(sys, "frozen", False) else "web/out"
-frontend_path = os.path.join(base_dir, frontend_dist_name)
-
 if os.path.exists(frontend_path):
     # Mount _next static files
     next_static_path = os.path.join(frontend_path, "_next")
     if os.path.exists(next_static_path):
-        app.mount("/_next", StaticFiles(directory=next_static_path), name="next")
-
-    @app.get("/")
-    async def serve_index():
-        return FileResponse(os.path.join(frontend_path, "index.html"))
-
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        file_path = os.path.join(frontend_path, full_path)
-        if os.path.isfile(file_path):
-            return FileResponse(file_path)
+        app.mount(
+            "/_next", ImmutableStaticFiles(directory=next_static_path), name="next"
+        )
 
-        # Fallback to index.html for SPA routing
-        return FileResponse(os.path.join(frontend_path, "index.html"))
+    # The export is fixed at startup, so only known paths touch the disk
+    app.add_middleware(
+        SPAMiddleware,
+        passthrough_prefixes=(
+            "/api/",
+            "/uploads/",
+            "/user_recordings/",
+            "/_next/",
+            "/docs",
+            "/redoc",
+            "/openapi.json",
+        ),
+    )
 
 else:
     logger.warning(f"Frontend not found at {frontend_path}")
@@ -92,8 +228,6 @@ if __name__ == "__main__":
     import uvicorn
     import webbrowser
     import socket
-    import threading
-    import time
 
     if getattr(sys, "frozen", False):
         os.chdir(base_dir)
@@ -119,4 +253,7 @@ if __name__ == "__main__":
     print(f"Starting server at http://localhost:{port}")
     threading.Thread(target=open_browser, daemon=True).start()
 
+    # uvicorn picks uvloop and httptools when they are installed. A single
+    # process on purpose: task progress, the playback buffer, the task queue
+    # and the ASR model all live in this process's memory.
     uvicorn.run(app, host="127.0.0.1", port=port)
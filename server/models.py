@@ -20,7 +20,8 @@ class Task(Base):
     progress: Mapped[float] = mapped_column(Float, default=0.0)
     lastPlayedChunkIndex: Mapped[int] = mapped_column(Integer, default=0)
     message: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    # JSON string; deferred so status polls and listings don't load it
+    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     createdAt: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -1,14 +1,22 @@
+import asyncio
+import atexit
 import os
+import queue
 import uuid
 import logging
 import shutil
-import json
+import threading
 import time
-from typing import Dict
-
-import soundfile as sf
-from fastapi import APIRouter, UploadFile, File, BackgroundTasks, HTTPException, Depends
-from fastapi.responses import FileResponse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import numpy as np
+import orjson
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import Row, bindparam, delete, func, lambda_stmt, or_, select, update
 from sqlalchemy.orm import Session
 
 from server.schemas import TaskResponse, TaskStatus, SubtitleResponse
@@ -28,24 +36,244 @@ logger = logging.getLogger(__name__)
 LOG_DIR = "output/log"
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Only add file handler if it doesn't already exist
-if not any(
-    isinstance(h, logging.FileHandler)
-    and h.baseFilename == os.path.abspath(os.path.join(LOG_DIR, "audio_processing.log"))
-    for h in logger.handlers
-):
+# Only add the file logging if it doesn't already exist. Records are queued
+# and written by a listener thread, so logging never blocks on the disk.
+if not any(isinstance(h, QueueHandler) for h in logger.handlers):
     file_handler = logging.FileHandler(
-        os.path.join(LOG_DIR, "audio_processing.log"), encoding="utf-8"
+        os.path.join(LOG_DIR, "audio_processing.log"), encoding="utf-8", delay=True
     )
     file_handler.setFormatter(
         logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     )
-    logger.addHandler(file_handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, file_handler)
+    log_listener.start()
+    # Flush what is still queued on interpreter exit
+    atexit.register(log_listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
     logger.setLevel(logging.INFO)
 
 UPLOAD_DIR = "output/uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Transcription jobs run here rather than in Starlette's shared threadpool, so
+# they queue behind each other instead of competing with request handlers.
+# One worker: there is a single ASR model instance to feed.
+TASK_WORKERS = 1
+task_executor = ThreadPoolExecutor(
+    max_workers=TASK_WORKERS, thread_name_prefix="audio-task"
+)
+
+# Copy buffer for uploaded files
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _save_upload(src, file_path: str) -> None:
+    """Copy an uploaded file to disk."""
+    with open(file_path, "wb") as f:
+        shutil.copyfileobj(src, f, length=UPLOAD_CHUNK_SIZE)
+
+
+# Progress of running jobs between status commits, keyed by task id. Only the
+# job's own worker writes its entry; readers overlay it on the stored value.
+_TASK_PROGRESS: Dict[str, float] = {}
+
+# Latest playback position per task, written to the database in batches
+PLAYBACK_FLUSH_SECONDS = 2.0
+_PLAYBACK_PROGRESS: Dict[str, int] = {}
+_playback_lock = threading.Lock()
+_playback_update = (
+    Task.__table__.update()
+    .where(Task.__table__.c.id == bindparam("task_id"))
+    .values(lastPlayedChunkIndex=bindparam("index"))
+)
+
+
+def flush_playback_progress() -> None:
+    """Write the buffered playback positions in one executemany UPDATE."""
+    # Entries stay buffered until committed, so readers never fall back to
+    # the older stored value while the write is in flight
+    with _playback_lock:
+        pending = _PLAYBACK_PROGRESS.copy()
+    if not pending:
+        return
+
+    try:
+        with SessionLocal() as db:
+            db.connection().execute(
+                _playback_update,
+                [{"task_id": k, "index": v} for k, v in pending.items()],
+            )
+            db.commit()
+    except Exception as e:
+        logger.error(f"Failed to flush playback progress: {e}")
+        return
+
+    # Drop only what was written; newer positions wait for the next flush
+    with _playback_lock:
+        for task_id, index in pending.items():
+            if _PLAYBACK_PROGRESS.get(task_id) == index:
+                del _PLAYBACK_PROGRESS[task_id]
+
+
+async def run_playback_flusher() -> None:
+    """Flush buffered playback positions every PLAYBACK_FLUSH_SECONDS."""
+    while True:
+        await asyncio.sleep(PLAYBACK_FLUSH_SECONDS)
+        await asyncio.to_thread(flush_playback_progress)
+
+
+def reset_interrupted_tasks() -> None:
+    """
+    Release tasks left PROCESSING by a previous run: their jobs were dropped
+    from the queue on shutdown or died with the process. Audio tasks go back
+    to PENDING so they can be started again; text uploads still waiting for
+    their generated audio cannot be resumed and are marked FAILED.
+    """
+    interrupted = Task.status == TaskStatus.PROCESSING
+    file_path = func.lower(Task.filePath)
+    text_upload = or_(file_path.endswith(".txt"), file_path.endswith(".md"))
+
+    with SessionLocal() as db:
+        db.execute(
+            update(Task)
+            .where(interrupted, text_upload)
+            .values(
+                status=TaskStatus.FAILED,
+                message="Interrupted before audio generation finished",
+            )
+        )
+        db.execute(
+            update(Task)
+            .where(interrupted)
+            .values(status=TaskStatus.PENDING, progress=0.0, message=None)
+        )
+        db.commit()
+
+
+# The Task columns _to_task_response reads; selecting just these yields rows
+# that can stand in for Task objects
+_TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.status,
+    Task.message,
+    Task.progress,
+    Task.lastPlayedChunkIndex,
+    Task.filePath,
+    Task.filename,
+    Task.duration,
+    Task.createdAt,
+)
+
+
+def _to_task_response(task: Task | Row, message: Optional[str] = None) -> TaskResponse:
+    return TaskResponse(
+        task_id=task.id,
+        status=TaskStatus(task.status),
+        message=task.message if message is None else message,
+        progress=_TASK_PROGRESS.get(task.id, task.progress),
+        last_played_chunk_index=_PLAYBACK_PROGRESS.get(
+            task.id, task.lastPlayedChunkIndex
+        ),
+        file_path=task.filePath,
+        filename=task.filename,
+        duration=task.duration,
+        created_at=task.createdAt,
+    )
+
+
+def _get_task_or_404(db: Session, task_id: str) -> Task:
+    """Primary-key lookup that checks the session's identity map first."""
+    task = db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+# Parsed results kept in memory; each can be several MB of segments + SRT
+RESULT_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _load_result(task_id: str) -> dict:
+    """
+    Parse a completed task's stored result. A result never changes once the
+    task has completed and task ids are never reused, so the task id alone is
+    the cache key. Callers must treat the returned dict as read-only.
+    """
+    with SessionLocal() as db:
+        raw = db.scalar(select(Task.result).where(Task.id == task_id))
+    if not raw:
+        # Raised, so lru_cache does not remember the miss
+        raise HTTPException(status_code=500, detail="Result is missing")
+    return orjson.loads(raw)
+
+
+def _srt_path(task_id: str) -> str:
+    return os.path.join(UPLOAD_DIR, f"{task_id}.srt")
+
+
+def _write_srt(srt_path: str, srt_content: str) -> None:
+    with open(srt_path, "w", encoding="utf-8") as f:
+        f.write(srt_content)
+
+
+# Upper bound on concurrent unlinks when deleting a task's files
+UNLINK_WORKERS = 16
+
+
+def _safe_unlink(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to delete file {path}: {e}")
+
+
+def _get_recordings(db: Session, task_id: str) -> list[PracticeRecording]:
+    # lambda_stmt caches the compiled SELECT; only task_id is bound per call
+    stmt = lambda_stmt(
+        lambda: select(PracticeRecording).where(PracticeRecording.taskId == task_id)
+    )
+    return list(db.scalars(stmt))
+
+
+# Silence (in seconds) between token end times that starts a new segment
+SILENCE_GAP_SECONDS = 2.0
+
+
+def _split_on_silence(tokens: list, timestamps: list) -> list[dict]:
+    """
+    Split ASR tokens into segments wherever the end times of two neighbouring
+    tokens are more than SILENCE_GAP_SECONDS apart.
+
+    Token start times are not available, so the gap is measured end to end;
+    tokens are short enough that this only overestimates it slightly.
+    """
+    if not tokens or len(tokens) != len(timestamps):
+        return []
+
+    ts = np.asarray(timestamps, dtype=np.float64)
+    split_idx = (np.flatnonzero(np.diff(ts) > SILENCE_GAP_SECONDS) + 1).tolist()
+
+    # Slice the original lists by segment bounds; no per-token appends and
+    # the values stay plain Python objects
+    segments = []
+    for start, end in zip([0, *split_idx], [*split_idx, len(tokens)]):
+        chunk_tokens = tokens[start:end]
+        chunk_ts = timestamps[start:end]
+        segments.append(
+            {
+                "text": "".join(chunk_tokens),
+                "start": chunk_ts[0] - 0.5 if chunk_ts[0] > 0.5 else 0.0,
+                "end": chunk_ts[-1],
+                "tokens": chunk_tokens,
+                "timestamps": chunk_ts,
+            }
+        )
+    return segments
+
 
 def process_audio_task(task_id: str):
     db = SessionLocal()
@@ -53,11 +281,13 @@ def process_audio_task(task_id: str):
     total_start = time.perf_counter()
     timings: Dict[str, float] = {}
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
+        task = db.get(Task, task_id)
         if not task:
             logger.error(f"Task {task_id} not found in background task")
             return
 
+        # Only status transitions are committed; progress in between is
+        # published through _TASK_PROGRESS
         task.status = TaskStatus.PROCESSING
         task.progress = 0.1
         db.commit()
@@ -66,26 +296,19 @@ def process_audio_task(task_id: str):
         step_start = time.perf_counter()
         wav_path = convert_to_wav(task.filePath)
         timings["convert_to_wav"] = time.perf_counter() - step_start
-        task.progress = 0.3
-        db.commit()
+        _TASK_PROGRESS[task_id] = 0.3
 
         # 2. ASR
         step_start = time.perf_counter()
         asr_result = transcribe_audio(wav_path)
         timings["transcribe_audio"] = time.perf_counter() - step_start
-        task.progress = 0.6
-        db.commit()
+        _TASK_PROGRESS[task_id] = 0.6
 
         # 3. NLP Split
         config = load_config()
 
-        # Calculate duration from audio file for fallback
-        try:
-            audio_info = sf.info(wav_path)
-            file_duration = audio_info.duration
-        except Exception as e:
-            logger.warning(f"Could not get duration from audio file: {e}")
-            file_duration = 0.0
+        # Audio duration as measured by the ASR, for fallback
+        file_duration = asr_result.get("duration", 0.0)
 
         # Cleanup temporary WAV file if it was created
         if wav_path != task.filePath and os.path.exists(wav_path):
@@ -95,64 +318,9 @@ def process_audio_task(task_id: str):
                 logger.warning(f"Failed to remove temporary WAV file {wav_path}: {e}")
 
         # Pre-process: Split ASR result by silence gaps to avoid merging sentences across large silences
-        asr_tokens = asr_result.get("tokens", [])
-        asr_timestamps = asr_result.get("timestamps", [])
-
-        segments = []
-
-        if asr_tokens and asr_timestamps and len(asr_tokens) == len(asr_timestamps):
-            current_tokens = []
-            current_timestamps = []
-            last_end = 0.0
-
-            for i, (tok, end) in enumerate(zip(asr_tokens, asr_timestamps)):
-                # Check gap (threshold 2.0s)
-                # Note: end is the end time of the current token.
-                # We compare it with last_end (end time of previous token).
-                # If end - last_end is large, it means there is a gap BEFORE this token.
-                # But wait, 'end' includes the duration of the current token.
-                # So the gap is (start_of_current - end_of_prev).
-                # Since we don't have start_of_current, we use (end_of_current - duration_of_current - end_of_prev).
-                # Assuming duration is small (<1s), if (end - last_end) > 3.0s, it's likely a gap.
-
-                if i > 0 and (end - last_end > 2.0):
-                    # Flush current segment
-                    if current_tokens:
-                        segments.append(
-                            {
-                                "text": "".join(current_tokens),
-                                "start": (
-                                    current_timestamps[0] - 0.5
-                                    if current_timestamps[0] > 0.5
-                                    else 0.0
-                                ),
-                                "end": last_end,
-                                "tokens": current_tokens,
-                                "timestamps": current_timestamps,
-                            }
-                        )
-                    current_tokens = []
-                    current_timestamps = []
-
-                current_tokens.append(tok)
-                current_timestamps.append(end)
-                last_end = end
-
-            # Flush last
-            if current_tokens:
-                segments.append(
-                    {
-                        "text": "".join(current_tokens),
-                        "start": (
-                            current_timestamps[0] - 0.5
-                            if current_timestamps[0] > 0.5
-                            else 0.0
-                        ),
-                        "end": last_end,
-                        "tokens": current_tokens,
-                        "timestamps": current_timestamps,
-                    }
-                )
+        segments = _split_on_silence(
+            asr_result.get("tokens", []), asr_result.get("timestamps", [])
+        )
 
         if not segments:
             # Fallback if no tokens or splitting failed
@@ -181,16 +349,17 @@ def process_audio_task(task_id: str):
         step_start = time.perf_counter()
         refined_segments = split_sentences(segments, config)
         timings["split_sentences"] = time.perf_counter() - step_start
-        task.progress = 0.9
-        db.commit()
+        _TASK_PROGRESS[task_id] = 0.9
 
         # 4. Generate SRT
         step_start = time.perf_counter()
         srt_content = generate_srt(refined_segments)
+        # Written once here so downloads only have to send the file
+        _write_srt(_srt_path(task_id), srt_content)
         timings["generate_srt"] = time.perf_counter() - step_start
 
         result_data = {"segments": refined_segments, "srt": srt_content}
-        task.result = json.dumps(result_data)
+        task.result = orjson.dumps(result_data).decode()
         task.status = TaskStatus.COMPLETED
         task.progress = 1.0
         db.commit()
@@ -203,6 +372,9 @@ def process_audio_task(task_id: str):
             task.message = str(e)
             db.commit()
     finally:
+        # The final state is committed, so the stored progress is current
+        _TASK_PROGRESS.pop(task_id, None)
+
         total_elapsed = time.perf_counter() - total_start
         timings["total"] = total_elapsed
 
@@ -233,7 +405,7 @@ def convert_text_and_process(task_id: str, temp_text_path: str, original_filenam
     db = SessionLocal()
     task = None
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
+        task = db.get(Task, task_id)
         if not task:
             logger.error(f"Task {task_id} not found in text conversion task")
             return
@@ -281,8 +453,7 @@ def convert_text_and_process(task_id: str, temp_text_path: str, original_filenam
 
 
 @router.post("/upload", response_model=TaskResponse)
-async def upload_audio(
-    background_tasks: BackgroundTasks,
+def upload_audio(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
@@ -294,8 +465,7 @@ async def upload_audio(
     if ext in [".txt", ".md"]:
         # Save text file temporarily
         temp_text_path = os.path.join(UPLOAD_DIR, f"{task_id}_{filename}")
-        with open(temp_text_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        _save_upload(file.file, temp_text_path)
 
         # Create task immediately
         new_task = Task(
@@ -310,26 +480,16 @@ async def upload_audio(
         db.commit()
         db.refresh(new_task)
 
-        # Offload to background
-        background_tasks.add_task(
+        # Offload to the task worker
+        task_executor.submit(
             convert_text_and_process, task_id, temp_text_path, filename
         )
 
-        return TaskResponse(
-            task_id=new_task.id,
-            status=TaskStatus(new_task.status),
-            message=new_task.message,
-            progress=new_task.progress,
-            file_path=new_task.filePath,
-            filename=new_task.filename,
-            duration=new_task.duration,
-            created_at=new_task.createdAt,
-        )
+        return _to_task_response(new_task)
 
     else:
         file_path = os.path.join(UPLOAD_DIR, f"{task_id}_{filename}")
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        _save_upload(file.file, file_path)
 
         new_task = Task(
             id=task_id,
@@ -342,127 +502,88 @@ async def upload_audio(
         db.commit()
         db.refresh(new_task)
 
-        return TaskResponse(
-            task_id=new_task.id,
-            status=TaskStatus(new_task.status),
-            message="File uploaded successfully",
-            progress=new_task.progress,
-            file_path=new_task.filePath,
-            filename=new_task.filename,
-            duration=new_task.duration,
-            created_at=new_task.createdAt,
-        )
+        return _to_task_response(new_task, "File uploaded successfully")
 
 
 @router.post("/process/{task_id}", response_model=TaskResponse)
-async def process_audio(
-    task_id: str, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
-):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+def process_audio(task_id: str, db: Session = Depends(get_db)):
+    task = _get_task_or_404(db, task_id)
 
     if task.status != TaskStatus.PENDING:
-        return TaskResponse(
-            task_id=task.id,
-            status=TaskStatus(task.status),
-            message=task.message,
-            progress=task.progress,
-            last_played_chunk_index=task.lastPlayedChunkIndex,
-            file_path=task.filePath,
-            filename=task.filename,
-            duration=task.duration,
-            created_at=task.createdAt,
-        )
-
-    background_tasks.add_task(process_audio_task, task_id)
+        return _to_task_response(task)
 
+    # Commit before queueing so the worker's own status updates land last
     task.status = TaskStatus.PROCESSING
     db.commit()
 
-    return TaskResponse(
-        task_id=task.id,
-        status=TaskStatus(task.status),
-        message="Processing started",
-        progress=task.progress,
-        last_played_chunk_index=task.lastPlayedChunkIndex,
-        file_path=task.filePath,
-        filename=task.filename,
-        duration=task.duration,
-        created_at=task.createdAt,
-    )
+    task_executor.submit(process_audio_task, task_id)
+
+    return _to_task_response(task, "Processing started")
 
 
 @router.get("/status/{task_id}", response_model=TaskResponse)
-async def get_status(task_id: str, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+def get_status(task_id: str, db: Session = Depends(get_db)):
+    task = _get_task_or_404(db, task_id)
 
-    return TaskResponse(
-        task_id=task.id,
-        status=TaskStatus(task.status),
-        message=task.message,
-        progress=task.progress,
-        last_played_chunk_index=task.lastPlayedChunkIndex,
-        file_path=task.filePath,
-        filename=task.filename,
-        duration=task.duration,
-        created_at=task.createdAt,
-    )
+    return _to_task_response(task)
 
 
-@router.get("/result/{task_id}", response_model=SubtitleResponse)
-async def get_result(task_id: str, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+@router.get(
+    "/result/{task_id}",
+    response_model=None,
+    responses={200: {"model": SubtitleResponse}},
+)
+def get_result(task_id: str, db: Session = Depends(get_db)) -> Response:
+    task = _get_task_or_404(db, task_id)
 
     if task.status != TaskStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Task not completed")
 
-    if not task.result:
-        raise HTTPException(status_code=500, detail="Result is missing")
-
-    result_data = json.loads(task.result)
-    return SubtitleResponse(task_id=task.id, segments=result_data["segments"])
+    # The stored segments were produced by split_sentences and already have the
+    # SubtitleSegment shape, so they are encoded as-is instead of being built
+    # into one model per segment and dumped again
+    result_data = _load_result(task.id)
+    return Response(
+        orjson.dumps({"task_id": task.id, "segments": result_data["segments"]}),
+        media_type="application/json",
+    )
 
 
 @router.get("/download/{task_id}/srt")
-async def download_srt(task_id: str, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+def download_srt(task_id: str, db: Session = Depends(get_db)):
+    task = _get_task_or_404(db, task_id)
 
     if task.status != TaskStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Task not completed")
 
-    if not task.result:
-        raise HTTPException(status_code=500, detail="Result is missing")
-
-    result_data = json.loads(task.result)
-    srt_content = result_data.get("srt", "")
-
-    # Save SRT to a temp file to serve it
-    srt_path = os.path.join(UPLOAD_DIR, f"{task_id}.srt")
-    with open(srt_path, "w", encoding="utf-8") as f:
-        f.write(srt_content)
+    # Written by the task; recreate it for tasks that predate that, or if the
+    # file has been removed since
+    srt_path = _srt_path(task_id)
+    try:
+        stat_result = os.stat(srt_path)
+    except FileNotFoundError:
+        _write_srt(srt_path, _load_result(task.id).get("srt", ""))
+        stat_result = os.stat(srt_path)
 
+    # The stat above doubles as FileResponse's, and the file never changes
+    # for a given task id
     return FileResponse(
-        srt_path, media_type="application/x-subrip", filename=f"subtitle_{task_id}.srt"
+        srt_path,
+        media_type="application/x-subrip",
+        filename=f"subtitle_{task_id}.srt",
+        stat_result=stat_result,
+        headers={"Cache-Control": "public, max-age=3600"},
     )
 
 
 @router.post("/practice/{task_id}/{segment_index}")
-async def upload_practice_recording(
+def upload_practice_recording(
     task_id: str,
     segment_index: int,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _get_task_or_404(db, task_id)
 
     # Save file
     recording_dir = "output/user_recordings"
@@ -473,8 +594,7 @@ async def upload_practice_recording(
     filename = f"{task_id}_{segment_index}_{uuid.uuid4()}{ext}"
     file_path = os.path.join(recording_dir, filename)
 
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    _save_upload(file.file, file_path)
 
     # Save to DB
     recording = PracticeRecording(
@@ -490,10 +610,8 @@ async def upload_practice_recording(
 
 
 @router.get("/practice/{task_id}")
-async def get_practice_recordings(task_id: str, db: Session = Depends(get_db)):
-    recordings = (
-        db.query(PracticeRecording).filter(PracticeRecording.taskId == task_id).all()
-    )
+def get_practice_recordings(task_id: str, db: Session = Depends(get_db)):
+    recordings = _get_recordings(db, task_id)
     return [
         {
             "id": r.id,
@@ -506,69 +624,60 @@ async def get_practice_recordings(task_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/tasks", response_model=list[TaskResponse])
-async def list_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    tasks = db.query(Task).offset(skip).limit(limit).all()
-    return [
-        TaskResponse(
-            task_id=task.id,
-            status=TaskStatus(task.status),
-            message=task.message,
-            progress=task.progress,
-            last_played_chunk_index=task.lastPlayedChunkIndex,
-            file_path=task.filePath,
-            filename=task.filename,
-            duration=task.duration,
-            created_at=task.createdAt,
-        )
-        for task in tasks
-    ]
+def list_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    # Plain rows: no ORM instances or identity map entries for a listing
+    rows = db.execute(select(*_TASK_RESPONSE_COLUMNS).offset(skip).limit(limit))
+    return [_to_task_response(row) for row in rows]
 
 
 @router.post("/tasks/{task_id}/progress")
-async def update_task_progress(
+def update_task_progress(
     task_id: str, last_played_chunk_index: int, db: Session = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _get_task_or_404(db, task_id)
 
-    task.lastPlayedChunkIndex = last_played_chunk_index
-    db.commit()
+    # Playback reports arrive several times a second; only the latest one per
+    # task is written, by run_playback_flusher
+    with _playback_lock:
+        _PLAYBACK_PROGRESS[task_id] = last_played_chunk_index
     return {"message": "Progress updated"}
 
 
 @router.delete("/task/{task_id}")
-async def delete_task(task_id: str, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+def delete_task(task_id: str, db: Session = Depends(get_db)):
+    task = _get_task_or_404(db, task_id)
+
+    with _playback_lock:
+        _PLAYBACK_PROGRESS.pop(task_id, None)
 
-    # 1. Delete practice recording files
+    # 1. Practice recording files
     # Note: PracticeRecording.filePath is stored as filename relative to output/user_recordings
     recording_dir = "output/user_recordings"
-    # Ensure recordings are loaded
-    recordings = (
-        db.query(PracticeRecording).filter(PracticeRecording.taskId == task_id).all()
+    # Only the paths are needed, not full ORM objects
+    stmt = lambda_stmt(
+        lambda: select(PracticeRecording.filePath).where(
+            PracticeRecording.taskId == task_id
+        )
     )
+    paths = [
+        os.path.join(recording_dir, file_path)
+        for file_path in db.scalars(stmt)
+        if file_path
+    ]
 
-    for recording in recordings:
-        if recording.filePath:
-            rec_path = os.path.join(recording_dir, recording.filePath)
-            if os.path.exists(rec_path):
-                try:
-                    os.remove(rec_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete recording file {rec_path}: {e}")
-
-    # 2. Delete task audio file
-    if task.filePath and os.path.exists(task.filePath):
-        try:
-            os.remove(task.filePath)
-        except Exception as e:
-            logger.warning(f"Failed to delete task file {task.filePath}: {e}")
+    # 2. Task audio and subtitle files
+    if task.filePath:
+        paths.append(task.filePath)
+    paths.append(_srt_path(task_id))
+
+    # Unlinks are independent, so slow filesystems are hit concurrently
+    with ThreadPoolExecutor(max_workers=min(UNLINK_WORKERS, len(paths))) as ex:
+        list(ex.map(_safe_unlink, paths))
 
-    # 3. Delete task from DB (cascades to recordings)
-    db.delete(task)
+    # 3. Delete task and recordings from DB, one statement each instead of
+    # loading the recordings for the ORM cascade
+    db.execute(delete(PracticeRecording).where(PracticeRecording.taskId == task_id))
+    db.execute(delete(Task).where(Task.id == task_id))
     db.commit()
 
     return {"message": "Task deleted successfully"}
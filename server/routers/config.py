@@ -1,17 +1,32 @@
-import copy
+import asyncio
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
 from backend.exceptions import ConfigError
-from backend.utils import load_config
+from backend.llm import async_chat_completion, tts_llm
+from backend.utils import Config, load_config
 from server.schemas import ConfigResponse, ConfigUpdate
 
 router = APIRouter()
 
+# Fixed probe payloads for the connection tests; the chat client only
+# serializes the messages, so the constant is shared without copying
+_TEST_MESSAGES = [{"role": "user", "content": "Hello, are you working?"}]
+_TEST_TTS_TEXT = "Hello, this is a test."
 
-def _masked_config(config: dict) -> dict:
-    """Return a copy of the config with secrets redacted."""
-    masked = copy.deepcopy(config)
+
+def _masked_config(config: Config) -> dict:
+    """
+    Return a dict copy of the config with secrets redacted, limited to the
+    sections ConfigResponse describes.
+    """
+    masked = {
+        section: getattr(config, section).to_dict()
+        for section in ConfigResponse.model_fields
+    }
 
     if "llm" in masked and "api_key" in masked["llm"]:
         masked["llm"]["api_key"] = "********" if masked["llm"]["api_key"] else ""
@@ -22,13 +37,30 @@ def _masked_config(config: dict) -> dict:
     return masked
 
 
-@router.get("/", response_model=ConfigResponse)
-async def get_config():
+# (config, encoded masked view); load_config returns the same frozen object
+# until .env changes, so identity tells whether the view is current
+_public_config: Optional[Tuple[Config, bytes]] = None
+
+
+def _public_config_bytes(config: Config) -> bytes:
+    """Return the masked config as JSON, encoding it once per config object."""
+    global _public_config
+    cached = _public_config
+    if cached is None or cached[0] is not config:
+        cached = (config, orjson.dumps(_masked_config(config)))
+        _public_config = cached
+    return cached[1]
+
+
+@router.get("/", response_model=None, responses={200: {"model": ConfigResponse}})
+async def get_config() -> Response:
     try:
-        config = load_config()
-        return _masked_config(config)
+        config = await asyncio.to_thread(load_config)
     except ConfigError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    # Built from our own Config, so there is nothing for a response_model to
+    # validate; the schema is still documented through `responses`
+    return Response(_public_config_bytes(config), media_type="application/json")
 
 
 @router.patch("/", response_model=ConfigResponse)
@@ -44,27 +76,44 @@ async def update_config(config_update: ConfigUpdate):
     )
 
 
+def _upstream_error(e: Exception, prefix: str = "") -> HTTPException:
+    """
+    Turn a failed provider call into a 500 that carries the error message and,
+    when the exception has one, the provider's response body.
+    """
+    detail = str(e)
+    response = getattr(e, "response", None)
+    if response is not None:
+        try:
+            detail = f"{detail} - Response: {response.text}"
+        except Exception:
+            pass
+    return HTTPException(status_code=500, detail=f"{prefix}{detail}")
+
+
 @router.post("/test-llm")
-async def test_llm(config_update: ConfigUpdate):
+async def test_llm(config_update: ConfigUpdate, request: Request):
     """
     Test the LLM connection with the provided configuration.
     """
     try:
-        from backend.llm import chat_completion
+        # Loaded off the loop; it supplies the defaults for the request too
+        current_config = await asyncio.to_thread(load_config)
 
         api_key = config_update.llm.api_key if config_update.llm else None
         # If api_key is masked, try to load from current config
         if api_key == "********":
-            current_config = load_config()
-            api_key = current_config.get("llm", {}).get("api_key")
+            api_key = current_config.llm.api_key
 
         base_url = config_update.llm.base_url if config_update.llm else None
         model = config_update.llm.model if config_update.llm else None
 
-        messages = [{"role": "user", "content": "Hello, are you working?"}]
-
-        response = chat_completion(
-            messages=messages,
+        # Awaited on the app's shared client, so no thread is held for the
+        # round-trip and connections to the provider are reused
+        response = await async_chat_completion(
+            request.app.state.http_client,
+            current_config.llm,
+            messages=_TEST_MESSAGES,
             model=model,
             api_key=api_key,
             base_url=base_url,
@@ -81,14 +130,7 @@ async def test_llm(config_update: ConfigUpdate):
             raise HTTPException(status_code=500, detail="LLM returned no response")
 
     except Exception as e:
-        # Include the actual error message in the response
-        error_detail = str(e)
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_detail += f" - Response: {e.response.text}"
-            except Exception:
-                pass
-        raise HTTPException(status_code=500, detail=error_detail)
+        raise _upstream_error(e)
 
 
 @router.post("/test-tts")
@@ -97,13 +139,11 @@ async def test_tts(config_update: ConfigUpdate):
     Test the TTS connection with the provided configuration.
     """
     try:
-        from backend.llm import tts_llm
-
         api_key = config_update.tts.api_key if config_update.tts else None
         # If api_key is masked, try to load from current config
         if api_key == "********":
-            current_config = load_config()
-            api_key = current_config.get("tts", {}).get("api_key")
+            current_config = await asyncio.to_thread(load_config)
+            api_key = current_config.tts.api_key
 
         model = config_update.tts.model if config_update.tts else None
 
@@ -119,7 +159,7 @@ async def test_tts(config_update: ConfigUpdate):
             options.update(defaults.model_dump())
 
         # Test with a short text
-        audio_bytes = tts_llm("Hello, this is a test.", options=options)
+        audio_bytes = await asyncio.to_thread(tts_llm, _TEST_TTS_TEXT, options=options)
 
         if audio_bytes:
             return {
@@ -130,13 +170,4 @@ async def test_tts(config_update: ConfigUpdate):
             raise HTTPException(status_code=500, detail="TTS returned no audio")
 
     except Exception as e:
-        # Include the actual error message in the response
-        error_detail = str(e)
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_detail += f" - Response: {e.response.text}"
-            except Exception:
-                pass
-        raise HTTPException(
-            status_code=500, detail=f"TTS Connection failed: {error_detail}"
-        )
+        raise _upstream_error(e, "TTS Connection failed: ")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict
 from enum import Enum
 
@@ -14,6 +14,8 @@ from datetime import datetime
 
 
 class TaskResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     status: TaskStatus
     message: Optional[str] = None
@@ -26,6 +28,8 @@ class TaskResponse(BaseModel):
 
 
 class SubtitleSegment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start: float
     end: float
     text: str
@@ -33,11 +37,15 @@ class SubtitleSegment(BaseModel):
 
 
 class SubtitleResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     segments: List[SubtitleSegment]
 
 
 class ASRConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     method: str
     parakeet_model_dir: str
     enable_demucs: bool
@@ -45,18 +53,24 @@ class ASRConfig(BaseModel):
 
 
 class LLMConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     model: Optional[str] = None
 
 
 class TTSDefaults(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     language: str
     speed: str
     tone: str
 
 
 class TTSVoiceMap(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     male: str
     female: str
 